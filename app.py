@@ -200,7 +200,7 @@ def start_synthesis():
 @app.route('/ledger/<run_id>')
 def get_ledger(run_id):
     with run_states_lock:
-        events = run_states.get(run_id, {}).get('events', [])
+        events = list(run_states.get(run_id, {}).get('events', [])) # Ledger.events decodes its blocks lazily
     return jsonify(events)
 
 if __name__ == '__main__':
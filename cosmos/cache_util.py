@@ -0,0 +1,35 @@
+#
+# File: cosmos/cache_util.py
+#
+# Description:
+# The publish step shared by the on-disk caches (compiled binaries and
+# objects in cosmos/foundry/build_cache.py, parsed ASTs in
+# cosmos/parser/ast_cache.py). An entry is written under a staging name that
+# is unique per process and thread, then renamed over its final name, so a
+# concurrent reader sees either the old entry or the complete new one.
+#
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable
+
+def store_atomically(target: Path, write: Callable[[Path], None]) -> bool:
+    """
+    Creates `target`'s directory, lets `write(staging)` produce the entry under
+    a staging name and renames it over `target`. The caches are optimizations:
+    an OSError (read-only home, full disk) is swallowed and reported as False.
+    """
+    target = Path(target)
+    staging = target.with_name(f"{target.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write(staging)
+        os.replace(staging, target)
+        return True
+    except OSError:
+        try:
+            staging.unlink()
+        except OSError:
+            pass
+        return False
@@ -0,0 +1,120 @@
+#
+# File: cosmos/foundry/build_cache.py
+#
+# Description:
+# A content-addressed cache for compiled validation binaries. The validators
+# recompile the same artifact + harness pair on every invocation; here the
+# compiler flags and the bytes of every source are hashed with BLAKE2b, and a
+# previously built executable is reused on a hit. Constant translation units
+# (the test harnesses) are also kept as precompiled objects, so a cache miss
+# only compiles the artifact itself. The cache directory is bounded by a
+# simple least-recently-used eviction. Validators also share one scratch
+# directory per process for their build outputs.
+#
+
+import atexit
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+from cosmos.cache_util import store_atomically
+
+CACHE_DIR = Path.home() / ".cache" / "cosmos-validator"
+MAX_ENTRIES = 64
+
+_scratch_dir = None
+
+def get_scratch_dir() -> Path:
+    """Returns this process's scratch directory, created on first use and removed at exit."""
+    global _scratch_dir
+    if _scratch_dir is None:
+        _scratch_dir = Path(tempfile.mkdtemp(prefix="cosmos-val-"))
+        atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+    return _scratch_dir
+
+def _cache_key(compiler_args: List[str], sources: List[Path]) -> str:
+    """Hashes the compile flags and the content of every source into a cache key."""
+    digest = hashlib.blake2b(repr(compiler_args).encode())
+    for source in sources:
+        digest.update(b'|')
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+def _evict(cache_dir: Path, max_entries: int, pattern: str = "*.out"):
+    """Removes the least recently used entries once the cache exceeds its bound."""
+    entries = sorted(cache_dir.glob(pattern), key=lambda p: p.stat().st_mtime)
+    for stale in entries[:max(0, len(entries) - max_entries)]:
+        try:
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+
+def _store(built: Path, cached: Path, cache_dir: Path, max_entries: int) -> bool:
+    """Publishes a fresh build into the cache, then enforces the bound. Returns whether it was cached."""
+    if not store_atomically(cached, lambda staging: shutil.copy2(built, staging)):
+        return False
+    _evict(cache_dir, max_entries, f"*{cached.suffix}")
+    return True
+
+def _reuse(cached: Path, destination: Path = None) -> bool:
+    """
+    Marks a cache entry as recently used (copying it to `destination` first, if
+    given). An entry evicted by a concurrent build since it was looked up is a miss.
+    """
+    try:
+        if destination is not None:
+            shutil.copy2(cached, destination)
+        os.utime(cached) # Mark as recently used for the LRU eviction.
+        return True
+    except FileNotFoundError:
+        return False
+
+def compile_object_cached(compiler_args: List[str], source: Path, cache_dir: Path = CACHE_DIR, max_entries: int = MAX_ENTRIES) -> Tuple[subprocess.CompletedProcess, Path]:
+    """
+    Compiles a single source to an object file (`compiler_args + ['-c']`) once
+    and keeps it in the cache. Returns the CompletedProcess of the compiler
+    and the path of the cached object, which later links can list as a source.
+    """
+    key = _cache_key([*compiler_args, "-c"], [source])
+    cached_object = cache_dir / f"{key}.o"
+    command = [*compiler_args, "-c", "-o", str(cached_object), str(source)]
+
+    if _reuse(cached_object):
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr=""), cached_object
+
+    # Build in scratch space; an uncacheable location then still leaves a usable object.
+    built_object = get_scratch_dir() / f"{key}.{threading.get_ident()}.o"
+    result = subprocess.run([*compiler_args, "-c", "-o", str(built_object), str(source)], capture_output=True, text=True)
+    if result.returncode == 0 and _store(built_object, cached_object, cache_dir, max_entries):
+        return result, cached_object
+    return result, built_object
+
+def compile_cached(compiler_args: List[str], sources: List[Path], executable_path: Path, cache_dir: Path = CACHE_DIR, max_entries: int = MAX_ENTRIES, syntax_check: List[Path] = ()) -> subprocess.CompletedProcess:
+    """
+    Builds `compiler_args + ['-o', executable_path] + sources`, or copies the
+    binary from a previous identical build. Returns the CompletedProcess of
+    the compiler, or a synthetic successful one on a cache hit.
+    On a miss, the sources in `syntax_check` are first run through
+    `-fsyntax-only`; a malformed source fails there, without codegen or link.
+    """
+    command = [*compiler_args, "-o", str(executable_path), *map(str, sources)]
+    key = _cache_key(compiler_args, sources)
+    cached_binary = cache_dir / f"{key}.out"
+
+    if _reuse(cached_binary, executable_path):
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    if syntax_check:
+        precheck = subprocess.run([*compiler_args, "-fsyntax-only", *map(str, syntax_check)], capture_output=True, text=True)
+        if precheck.returncode != 0:
+            return precheck
+
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode == 0:
+        _store(executable_path, cached_binary, cache_dir, max_entries)
+    return result
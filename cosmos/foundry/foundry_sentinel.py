@@ -16,17 +16,27 @@
 
 import random
 import copy
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from .titans_sentinel import ExecutionTitan, JanusTitan, PerformanceTitan
 
 class SentinelFoundry:
-    def __init__(self, config):
+    def __init__(self, initial_genome: dict = None, config: dict = None):
+        """
+        `initial_genome` (e.g. the profiled baseline policy) seeds the
+        population; without one, every individual starts from a random policy.
+        """
+        config = config or {}
         self.population = []
+        self.initial_genome = dict(initial_genome or {})
         self.config = config
         self.population_size = config.get("population_size", 20)
         self.generations = config.get("generations", 20)
         self.mutation_rate = config.get("mutation_rate", 0.8)
         self.mutation_strength = config.get("mutation_strength", 0.2)
         self.elitism_count = config.get("elitism_count", 2)
+        self.parallel_workers = max(1, config.get("parallel_workers", 1))
+        self.mode = config.get("mode", "generational") # or "steady_state"
+        self.ledger = config.get("ledger")
         
         self.execution_titan = ExecutionTitan()
         self.janus_titan = JanusTitan()
@@ -49,11 +59,19 @@ class SentinelFoundry:
         print(f"[bold green]Calibration Complete. 'Normal' behavior is Profile ID: {self.normal_profile_id}[/bold green]")
 
     def _initialize_population(self):
-        """Initializes a population of diverse policy genomes."""
+        """
+        Initializes a population of diverse policy genomes. The seed genome is
+        kept verbatim as the first individual; the rest inherit its limits
+        with a randomized CPU threshold.
+        """
         for i in range(self.population_size):
-            genome = {
-                'max_cpu_percent': random.uniform(5.0, 50.0)
-            }
+            if i == 0 and self.initial_genome:
+                genome = dict(self.initial_genome)
+            else:
+                genome = {
+                    **self.initial_genome,
+                    'max_cpu_percent': random.uniform(5.0, 50.0)
+                }
             self.population.append({'genome': genome, 'fitness': -9999, 'breakdown': {}, 'id': i})
 
     def _evaluate_genome(self, individual: dict) -> dict:
@@ -112,16 +130,96 @@ class SentinelFoundry:
             new_pop.append(copy.deepcopy(winner))
         self.population = new_pop
 
+    def _mutate_genome(self, genome: dict):
+        key_to_mutate = random.choice(list(genome.keys()))
+        
+        # Perturb the value
+        change_factor = 1.0 + random.uniform(-self.mutation_strength, self.mutation_strength)
+        new_value = genome[key_to_mutate] * change_factor
+        
+        # Clamp values to be realistic
+        if 'cpu_percent' in key_to_mutate:
+            genome[key_to_mutate] = max(1.0, min(95.0, new_value))
+
     def _mutate_population(self):
         for i in range(self.elitism_count, self.population_size):
             if random.random() < self.mutation_rate:
-                genome = self.population[i]['genome']
-                key_to_mutate = random.choice(list(genome.keys()))
-                
-                # Perturb the value
-                change_factor = 1.0 + random.uniform(-self.mutation_strength, self.mutation_strength)
-                new_value = genome[key_to_mutate] * change_factor
-                
-                # Clamp values to be realistic
-                if 'cpu_percent' in key_to_mutate:
-                    genome[key_to_mutate] = max(1.0, min(95.0, new_value))
\ No newline at end of file
+                self._mutate_genome(self.population[i]['genome'])
+
+    def _breed(self, pool: list, offspring_id: int) -> dict:
+        """Tournament-selects a parent from the evaluated pool and returns a mutated copy."""
+        participants = random.sample(pool, k=min(5, len(pool)))
+        child = copy.deepcopy(max(participants, key=lambda x: x['fitness']))
+        if random.random() < self.mutation_rate:
+            self._mutate_genome(child['genome'])
+        child.update({'fitness': -9999, 'breakdown': {}, 'id': offspring_id})
+        return child
+
+    def _log_progress(self, gen: int, champion: dict):
+        print(f"Generation {gen + 1}/{self.generations}: Champion fitness {champion['fitness']:.2f}")
+        if self.ledger:
+            self.ledger.record_event(block_height=gen + 1, event_type="GENERATION_COMPLETE", details={"generation": gen, "champion": champion})
+
+    def _run_generational(self, executor):
+        for gen in range(self.generations):
+            self.epoch = gen
+            self.population = list(executor.map(self._evaluate_genome, self.population))
+            self._log_progress(gen, max(self.population, key=lambda x: x['fitness']))
+            if gen < self.generations - 1:
+                self._selection()
+                self._mutate_population()
+
+    def _run_steady_state(self, executor):
+        """
+        Asynchronous steady-state evolution. A fixed number of evaluations is
+        kept in flight; whenever one completes, the result replaces the worst
+        member of the population (if it is better) and a new offspring is bred
+        and submitted at once, so no worker waits for the slowest run of a
+        generation. The evaluation budget matches the generational mode.
+        """
+        budget = self.population_size * self.generations
+        in_flight = min(self.parallel_workers, self.population_size)
+        unevaluated = iter(self.population)
+        evaluated = []
+        submitted = completed = 0
+
+        def submit_next():
+            nonlocal submitted
+            individual = next(unevaluated, None) or self._breed(evaluated, submitted)
+            submitted += 1
+            return executor.submit(self._evaluate_genome, individual)
+
+        pending = {submit_next() for _ in range(min(in_flight, budget))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                completed += 1
+                if len(evaluated) < self.population_size:
+                    evaluated.append(result)
+                else:
+                    worst = min(range(len(evaluated)), key=lambda i: evaluated[i]['fitness'])
+                    if result['fitness'] > evaluated[worst]['fitness']:
+                        evaluated[worst] = result
+                if completed % self.population_size == 0:
+                    self.epoch = completed // self.population_size - 1
+                    self._log_progress(self.epoch, max(evaluated, key=lambda x: x['fitness']))
+                if submitted < budget:
+                    pending.add(submit_next())
+        self.population = evaluated
+
+    def run_evolution(self) -> dict:
+        """
+        Calibrates the oracle, evolves the population and returns the champion.
+        Every evaluation is two independent instrumented runs that spend their
+        time waiting on a child process, so evaluations run on a pool of
+        `parallel_workers` threads, created once for the whole run.
+        """
+        self.calibrate()
+        self._initialize_population()
+        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+            if self.mode == "steady_state":
+                self._run_steady_state(executor)
+            else:
+                self._run_generational(executor)
+        return copy.deepcopy(max(self.population, key=lambda x: x['fitness']))
@@ -0,0 +1,32 @@
+#
+# File: cosmos/foundry/strace_scan.py
+#
+# Description:
+# The shared syscall counter for strace logs, used by the sentinel profiling
+# scripts. A whole log, or a stream of lines, is reduced to the number of
+# completed system calls without ever building a regex match list.
+#
+
+import re
+
+# A strace line that completed a system call. strace pads short calls so the
+# result starts at column 40, e.g. `brk(NULL)                               = 0x55d0c000`.
+_SYSCALL_LINE = re.compile(rb'\w+\(.*\)\s*=')
+# The same pattern anchored at every line start, for scanning a whole log at once.
+_SYSCALL_LOG = re.compile(rb'(?m)^\w+\(.*\)\s*=')
+
+def count_syscalls(strace_log) -> int:
+    """
+    Counts completed system calls in a strace log, i.e. lines shaped like
+    `openat(AT_FDCWD, ...) = 3`. A call name is any run of word characters
+    (`_llseek` included); `<... resumed>`, signal and exit lines never match.
+    A whole log is scanned in one pass over the buffer. Any iterable of byte
+    lines is also accepted (e.g. a strace pipe opened in binary mode), so the
+    log can be counted as it streams in.
+    """
+    if isinstance(strace_log, str):
+        strace_log = strace_log.encode()
+    if isinstance(strace_log, bytes):
+        return sum(1 for _ in _SYSCALL_LOG.finditer(strace_log))
+    match = _SYSCALL_LINE.match
+    return sum(1 for line in strace_log if match(line))
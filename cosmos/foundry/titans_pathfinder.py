@@ -7,7 +7,8 @@ import pandas as pd
 import joblib
 import psutil
 import json
-from typing import Dict, Any, List
+import operator
+from typing import Dict, Any, List, Callable
 
 from rich.console import Console
 console = Console()
@@ -46,6 +47,14 @@ def _engineer_fingerprint_from_telemetry(telemetry: List[Dict[str, Any]], featur
 
     return pd.DataFrame({feat: [features.get(feat, 0)] for feat in feature_list})
 
+# --- Compiled Policy Primitives ---
+_RULE_OPERATORS = {'GT': operator.gt, 'LT': operator.lt, 'EQ': operator.eq, 'NEQ': operator.ne}
+
+def _never(reading: dict) -> bool:
+    return False
+
+_EMPTY_STATE = {'active_policy': _never, 'transitions': []}
+
 class ExecutionTitan:
     """[ARCHITECT ENFORCER & VM] Runs the target, enforces the stateful policy, and collects raw evidence."""
     def __init__(self):
@@ -83,11 +92,46 @@ class ExecutionTitan:
             if op == 'XOR': return sum(1 for o in outcomes if o) == 1
         return False
 
-    def instrumented_run(self, payload: bytes, genome: Dict, timeout: int = 5) -> Dict[str, Any]:
+    def _compile_policy_node(self, node: dict) -> Callable[[dict], bool]:
+        """Lowers a policy node into a closure with the same semantics as `_evaluate_policy_node`."""
+        if node.get('type') == 'rule':
+            metric, value = node['metric'], node['value']
+            compare = _RULE_OPERATORS.get(node['operator'])
+            if compare is None: return _never
+            def rule(reading: dict) -> bool:
+                observed = reading.get(metric)
+                return observed is not None and compare(observed, value)
+            return rule
+        if 'children' in node:
+            children = [self._compile_policy_node(c) for c in node['children']]
+            op = node['operator']
+            if op == 'AND': return lambda reading: all(c(reading) for c in children)
+            if op == 'OR': return lambda reading: any(c(reading) for c in children)
+            if op == 'NAND': return lambda reading: not all(c(reading) for c in children)
+            if op == 'NOR': return lambda reading: not any(c(reading) for c in children)
+            if op == 'XOR': return lambda reading: sum(1 for c in children if c(reading)) == 1
+        return _never
+
+    def compile_policy(self, genome: Dict) -> Dict[str, Any]:
+        """
+        Compiles the stateful policy of a genome once, so that every telemetry
+        reading (and every run of the same genome) skips the recursive dict walk.
+        """
+        states = {}
+        for name, state_config in genome.get('states', {}).items():
+            states[name] = {
+                'active_policy': self._compile_policy_node(state_config.get('active_policy', {})),
+                'transitions': [(self._compile_policy_node(t.get('condition', {})), t.get('target_state')) for t in state_config.get('transitions', [])]
+            }
+        return {'initial_state': genome.get('initial_state', None), 'states': states}
+
+    def instrumented_run(self, payload: bytes, genome: Dict, timeout: int = 5, compiled_policy: Dict[str, Any] = None) -> Dict[str, Any]:
         telemetry: List[Dict[str, Any]] = []
         stop_monitoring = threading.Event()
         proc = None; mon_thread = None; outcome = 'unknown_error'
-        current_state = genome.get('initial_state', None)
+        if compiled_policy is None: compiled_policy = self.compile_policy(genome)
+        compiled_states = compiled_policy['states']
+        current_state = compiled_policy['initial_state']
         
         try:
             proc = subprocess.Popen([str(self.executable_path)], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
@@ -100,12 +144,12 @@ class ExecutionTitan:
                         with p.oneshot():
                             reading = {'cpu_percent_total': p.cpu_percent(interval=0.05), 'memory_rss_bytes': p.memory_info().rss, 'io_read_bytes': p.io_counters().read_bytes, 'io_write_bytes': p.io_counters().write_bytes, 'num_threads': p.num_threads()}
                             telemetry.append(reading)
-                        state_config = genome.get('states', {}).get(current_state, {})
-                        if self._evaluate_policy_node(state_config.get('active_policy', {}), reading): 
+                        state_config = compiled_states.get(current_state, _EMPTY_STATE)
+                        if state_config['active_policy'](reading): 
                             p.kill(); outcome = 'policy_violation'
-                        for t in state_config.get('transitions', []):
-                            if self._evaluate_policy_node(t.get('condition', {}), reading): 
-                                current_state = t.get('target_state'); break
+                        for condition, target_state in state_config['transitions']:
+                            if condition(reading): 
+                                current_state = target_state; break
                 except (psutil.NoSuchProcess, psutil.AccessDenied): pass
             
             mon_thread = threading.Thread(target=monitor_thread); mon_thread.start()
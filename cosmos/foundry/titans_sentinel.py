@@ -14,20 +14,29 @@
 
 import subprocess
 import os
+import shutil
+import signal
 import threading
 import time
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import joblib
 import psutil
 from typing import Dict, Any, List
+from .strace_scan import count_syscalls
 
 class ExecutionTitan:
     """[SENTINEL ENFORCER] Runs the target, enforces the policy, collects the evidence."""
+    PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+    # Class-level so callers can fingerprint the target without compiling it.
+    APP_SOURCE_PATH = PROJECT_ROOT / "data/genomes/cjson/cJSON.c"
+    HARNESS_PATH = PROJECT_ROOT / "data/genomes/uranus/cjson_harness.c"
+
     def __init__(self):
-        project_root = Path(__file__).resolve().parent.parent.parent
-        self.app_source_path = str(project_root / "data/genomes/cjson/cJSON.c")
-        self.harness_path = str(project_root / "data/genomes/uranus/cjson_harness.c")
+        project_root = self.PROJECT_ROOT
+        self.app_source_path = str(self.APP_SOURCE_PATH)
+        self.harness_path = str(self.HARNESS_PATH)
         self.header_dir = str(project_root / "data/genomes/cjson")
         self.compiler = "gcc"
         self.executable_path = project_root / "data/temp/sentinel_target.out"
@@ -39,15 +48,50 @@ class ExecutionTitan:
         if compile_res.returncode != 0:
             raise RuntimeError(f"FATAL: Sentinel target failed to compile!\n{compile_res.stderr}")
 
-    def instrumented_run(self, payload: bytes, genome: Dict[str, float], timeout: int = 5) -> Dict[str, Any]:
-        """Runs the pre-compiled target under observation and policy enforcement."""
+    def instrumented_run(self, payload: bytes, genome: Dict[str, float], timeout: int = 5, trace_syscalls: bool = False) -> Dict[str, Any]:
+        """
+        Runs the pre-compiled target under observation and policy enforcement.
+        With `trace_syscalls`, the target runs under strace and the result also
+        carries 'syscall_count' (None if the log could not be read to the end).
+        The telemetry of such a run samples strace itself, so profile CPU from
+        an untraced run.
+        """
         telemetry: List[Dict[str, Any]] = []
         stop_monitoring = threading.Event()
         proc = None
         mon_thread = None
+        command = [str(self.executable_path)]
+        strace_fds = None
+        syscall_count = [0]
+
+        if trace_syscalls:
+            if shutil.which("strace") is None:
+                raise RuntimeError("FATAL: trace_syscalls requires strace on the PATH.")
+            # strace writes its log into a pipe that is counted line by line as it
+            # arrives, so the log is never buffered whole.
+            strace_fds = os.pipe()
+            command = ["strace", "-o", f"/dev/fd/{strace_fds[1]}", *command]
+
+            def strace_reader():
+                with open(strace_fds[0], 'rb') as strace_log:
+                    syscall_count[0] = count_syscalls(strace_log)
+
+            strace_thread = threading.Thread(target=strace_reader, daemon=True)
+            strace_thread.start()
+
+        def kill_target():
+            if strace_fds:
+                # Killing strace alone would orphan the traced target, which keeps
+                # running and holding the log pipe open; kill its whole session.
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                p.kill()
         
         try:
-            proc = subprocess.Popen([str(self.executable_path)], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=False)
+            proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=False, pass_fds=strace_fds[1:] if strace_fds else (), start_new_session=bool(strace_fds))
             p = psutil.Process(proc.pid)
 
             def monitor_thread():
@@ -65,7 +109,7 @@ class ExecutionTitan:
                             telemetry.append({'cpu_percent': cpu, 'resident_memory_bytes': mem.rss})
                         # --- SENTINEL POLICY ENFORCEMENT ---
                         if telemetry and genome.get('max_cpu_percent', 100) < telemetry[-1]['cpu_percent']:
-                             p.kill()
+                             kill_target()
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass # Process finished, which is normal.
                 except Exception:
@@ -82,25 +126,30 @@ class ExecutionTitan:
 
         except subprocess.TimeoutExpired:
             outcome = 'timed_out'
-            if proc and proc.poll() is None:
-                p.kill()
+            if proc and (strace_fds or proc.poll() is None):
+                kill_target()
         except Exception:
             outcome = 'unknown_error'
         finally:
             stop_monitoring.set()
             if mon_thread:
                 mon_thread.join(timeout=1)
+            if strace_fds:
+                os.close(strace_fds[1]) # The reader sees EOF once strace and the target exit too.
+                strace_thread.join(timeout=timeout)
 
         # --- Aggregate Telemetry Snapshot ---
         snapshot = {}
         if telemetry:
-            df = pd.DataFrame(telemetry)
+            # Plain NumPy reductions; a DataFrame per run only added type inference and index overhead.
+            cpu = np.fromiter((t['cpu_percent'] for t in telemetry), dtype=np.float64, count=len(telemetry))
+            rss = np.fromiter((t['resident_memory_bytes'] for t in telemetry), dtype=np.float64, count=len(telemetry))
             snapshot = {
-                'max_cpu_percent': df['cpu_percent'].max(),
-                'avg_cpu_percent': df['cpu_percent'].mean(),
-                'max_resident_memory_bytes': df['resident_memory_bytes'].max(),
-                'avg_resident_memory_bytes': df['resident_memory_bytes'].mean(),
-                'observation_duration_ms': len(df) * 50 # Approximation
+                'max_cpu_percent': cpu.max(),
+                'avg_cpu_percent': cpu.mean(),
+                'max_resident_memory_bytes': rss.max(),
+                'avg_resident_memory_bytes': rss.mean(),
+                'observation_duration_ms': len(telemetry) * 50 # Approximation
             }
         else:
             # --- REFLEX FIX 2: HANDLE NO TELEMETRY ---
@@ -111,7 +160,11 @@ class ExecutionTitan:
                 'observation_duration_ms': 1 
             }
         
-        return {'outcome': outcome, 'telemetry_snapshot': snapshot}
+        result = {'outcome': outcome, 'telemetry_snapshot': snapshot}
+        if trace_syscalls:
+            # A reader still blocked on the pipe means the count is incomplete, not zero.
+            result['syscall_count'] = None if strace_thread.is_alive() else syscall_count[0]
+        return result
 
 
 class PerformanceTitan:
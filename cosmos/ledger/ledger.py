@@ -4,6 +4,7 @@ from datetime import datetime
 from pathlib import Path
 import os
 import binascii
+from collections.abc import Sequence
 from rich import print
 
 # [DEFINITIVE - V4.2 "OMEGA LEDGER - GUI COMPATIBLE" - FINAL VERSION]
@@ -14,6 +15,19 @@ from rich import print
 # - This makes the Ledger's state readable by the Flask GUI thread,
 #   resolving the 'AttributeError' without removing any features.
 
+class _FrozenEvents(Sequence):
+    """A live, read-only view of the ledger's frozen blocks, decoded on access."""
+    def __init__(self, serialized_blocks: list):
+        self._serialized_blocks = serialized_blocks
+
+    def __len__(self) -> int:
+        return len(self._serialized_blocks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [json.loads(block) for block in self._serialized_blocks[index]]
+        return json.loads(self._serialized_blocks[index])
+
 class Ledger:
     """
     Creates a cryptographically-chained, auditable log of an evolutionary run,
@@ -28,8 +42,13 @@ class Ledger:
         run_timestamp = self._get_timestamp(time_format="%Y%m%d_%H%M%S")
         self.ledger_path = self.output_dir / f"ledger_{run_timestamp}_{self.run_id}.json"
         
+        # Each block is serialized exactly once, when it is recorded, and only
+        # that frozen string is kept. `save()` writes it as is and `self.events`
+        # decodes it on access, so both always match the hashed content and
+        # callers may pass live objects instead of copies.
+        self._serialized_blocks = []
         # --- FIX: Renamed `self.chain` to `self.events` for GUI compatibility ---
-        self.events = []
+        self.events = _FrozenEvents(self._serialized_blocks)
         
         self.genesis_hash = '0' * 64
         self.previous_hash = self.genesis_hash
@@ -43,9 +62,13 @@ class Ledger:
         """Generates a UTC timestamp in a standardized format."""
         return datetime.utcnow().strftime(time_format)
 
+    def _serialize_block(self, block_data: dict) -> str:
+        """Serializes a block into the canonical form that is hashed and saved."""
+        return json.dumps(block_data, sort_keys=True, default=str)
+
     def _calculate_block_hash(self, block_data: dict) -> str:
         """Calculates the SHA-256 hash for a block."""
-        block_string = json.dumps(block_data, sort_keys=True, default=str).encode('utf-8')
+        block_string = self._serialize_block(block_data).encode('utf-8')
         return hashlib.sha256(block_string).hexdigest()
 
     def record_event(self, block_height: int, event_type: str, details: dict):
@@ -62,20 +85,19 @@ class Ledger:
             "previous_hash": self.previous_hash
         }
 
-        current_hash = self._calculate_block_hash(block)
-        block["block_hash"] = current_hash
-        
-        # --- FIX: Appending to `self.events` instead of `self.chain` ---
-        self.events.append(block)
+        block_string = self._serialize_block(block)
+        current_hash = hashlib.sha256(block_string.encode('utf-8')).hexdigest()
+        # Splice the hash into the already-serialized block instead of dumping it twice.
+        self._serialized_blocks.append(f'{block_string[:-1]}, "block_hash": "{current_hash}"}}')
         
         self.previous_hash = current_hash
 
     def save(self):
         """Saves the complete blockchain of events to a JSON file."""
         try:
-            # --- FIX: Dumping `self.events` instead of `self.chain` ---
+            # --- Writing the blocks frozen at record time; no re-serialization ---
             with open(self.ledger_path, 'w') as f:
-                json.dump(self.events, f, indent=2, default=str)
+                f.write("[\n" + ",\n".join(self._serialized_blocks) + "\n]")
             print(f"Successfully saved ledger with {len(self.events)} blocks to {self.ledger_path}")
         except (IOError, TypeError) as e:
             print(f"[bold red]Error: Could not write or serialize ledger. Reason: {e}[/bold red]")
\ No newline at end of file
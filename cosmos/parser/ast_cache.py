@@ -0,0 +1,43 @@
+#
+# File: cosmos/parser/ast_cache.py
+#
+# Description:
+# A disk memo for parsed C sources. Preprocessing and parsing a genome costs
+# far more than unpickling the resulting AST, and the sources rarely change,
+# so parse results are stored under a SHA-256 of the source bytes, the parse
+# function and its arguments. Headers pulled in by the preprocessor are not
+# part of the key; a header edit needs the cache directory cleared.
+#
+
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Callable
+
+from cosmos.cache_util import store_atomically
+
+CACHE_DIR = Path.home() / ".cache" / "cosmos-parser"
+
+def cache_entry(path, parse_fn: Callable[..., Any], *args, cache_dir: Path = CACHE_DIR, **kwargs) -> Path:
+    """Returns the cache file that holds (or would hold) `parse_fn(path, *args, **kwargs)`."""
+    digest = hashlib.sha256(Path(path).read_bytes())
+    digest.update(f"{parse_fn.__module__}.{parse_fn.__qualname__}|{args!r}|{sorted(kwargs.items())!r}".encode())
+    return cache_dir / f"{digest.hexdigest()}.pkl"
+
+def cached_parse(path, parse_fn: Callable[..., Any], *args, cache_dir: Path = CACHE_DIR, **kwargs) -> Any:
+    """Returns `parse_fn(path, *args, **kwargs)`, reusing a pickled result from an identical earlier parse."""
+    cached_ast = cache_entry(path, parse_fn, *args, cache_dir=cache_dir, **kwargs)
+
+    if cached_ast.exists():
+        try:
+            return pickle.loads(cached_ast.read_bytes())
+        except Exception:
+            pass # A truncated or stale entry is simply reparsed and overwritten.
+
+    ast = parse_fn(path, *args, **kwargs)
+    try:
+        data = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return ast # Unpicklable (or too deep to pickle); parse it again next time.
+    store_atomically(cached_ast, lambda staging: staging.write_bytes(data))
+    return ast
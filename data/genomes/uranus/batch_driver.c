@@ -0,0 +1,86 @@
+/*
+ * Uranus Batch Driver
+ * [DEFINITIVE - V1.0] Runs a whole test battery inside one process image.
+ * The harness is linked in with -Dmain=cosmos_harness_main; this driver then
+ * reads length-prefixed payloads (4-byte little-endian size + bytes) from
+ * stdin and forks once per payload, so a crash or hang only kills that
+ * child. One outcome line per payload is written to stdout:
+ *
+ *     EXIT <code>      the harness returned or called exit()
+ *     SIGNAL <signo>   the harness was killed (SIGALRM means it timed out)
+ */
+#undef main
+
+#include <fcntl.h>
+#include <signal.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+#define PAYLOAD_TIMEOUT_SECONDS 5
+
+int cosmos_harness_main(int argc, char **argv);
+
+static int read_exact(int fd, void *buf, size_t len) {
+    size_t done = 0;
+    while (done < len) {
+        ssize_t n = read(fd, (char *)buf + done, len - done);
+        if (n <= 0) return -1;
+        done += (size_t)n;
+    }
+    return 0;
+}
+
+static void write_all(int fd, const void *buf, size_t len) {
+    size_t done = 0;
+    while (done < len) {
+        ssize_t n = write(fd, (const char *)buf + done, len - done);
+        if (n <= 0) return;
+        done += (size_t)n;
+    }
+}
+
+int main(int argc, char **argv) {
+    unsigned char header[4];
+    signal(SIGPIPE, SIG_IGN); // A harness that stops reading early must not kill the driver.
+
+    while (read_exact(STDIN_FILENO, header, sizeof header) == 0) {
+        uint32_t len = (uint32_t)header[0] | (uint32_t)header[1] << 8 | (uint32_t)header[2] << 16 | (uint32_t)header[3] << 24;
+        char *payload = malloc(len ? len : 1);
+        if (payload == NULL || read_exact(STDIN_FILENO, payload, len) != 0) return 1;
+
+        int pipefd[2];
+        if (pipe(pipefd) != 0) return 1;
+
+        pid_t pid = fork();
+        if (pid < 0) return 1;
+        if (pid == 0) {
+            // The child sees only its own payload on stdin; its output is discarded
+            // so that it cannot interleave with the outcome stream.
+            int devnull = open("/dev/null", O_WRONLY);
+            dup2(pipefd[0], STDIN_FILENO);
+            dup2(devnull, STDOUT_FILENO);
+            dup2(devnull, STDERR_FILENO);
+            close(pipefd[0]); close(pipefd[1]); close(devnull);
+            alarm(PAYLOAD_TIMEOUT_SECONDS);
+            exit(cosmos_harness_main(argc, argv));
+        }
+
+        close(pipefd[0]);
+        write_all(pipefd[1], payload, len);
+        close(pipefd[1]);
+        free(payload);
+
+        int status;
+        char report[32];
+        waitpid(pid, &status, 0);
+        int n = WIFSIGNALED(status)
+            ? snprintf(report, sizeof report, "SIGNAL %d\n", WTERMSIG(status))
+            : snprintf(report, sizeof report, "EXIT %d\n", WEXITSTATUS(status));
+        write_all(STDOUT_FILENO, report, (size_t)n);
+    }
+    return 0;
+}
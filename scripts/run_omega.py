@@ -1,20 +1,18 @@
 import sys, time, multiprocessing, os
 from pathlib import Path
-import psutil, pandas as pd
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from cosmos.foundry.foundry_insitu import InSituSentinelFoundry
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 # --- OMEGA POINT: The final, correct architecture ---
 foundry_instance = None # Global for the workers
 
 def get_telemetry_for_payload(payload: bytes) -> dict:
     """A top-level function for clean telemetry gathering."""
+    # Imported here so that 'spawn' children re-importing this module skip them.
+    import psutil, pandas as pd
     live_readings = []
     try:
         # Create a worker process to run the payload
@@ -38,6 +36,8 @@ def get_telemetry_for_payload(payload: bytes) -> dict:
     except Exception: return {}
 
 def main():
+    from rich.console import Console
+    from rich.table import Table
     console = Console()
     console.rule("[bold green]COSMOS-Ω: OMEGA POINT[/bold green]")
     
@@ -4,11 +4,12 @@ import threading
 import traceback
 import os
 import json
+import heapq
 import logging
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import multiprocessing
-import pandas as pd
+import numpy as np
 
 # The project root setup for imports must be preserved
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -16,6 +17,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # Imports are structured based on the intended file hierarchy
 from cosmos.foundry.foundry_pathfinder import SentinelFoundry
+from cosmos.foundry.titans_pathfinder import _engineer_fingerprint_from_telemetry
 # Assuming cosmos.ledger.ledger exists for this import to work
 from cosmos.ledger.ledger import Ledger 
 from rich.console import Console
@@ -33,16 +35,33 @@ from rich.rule import Rule
 # --- WORKER INITIALIZATION ---
 
 worker_execution_titan = None
+# Payload corpora, built once per worker by its own foundry and never pickled per task.
+worker_payloads = {}
+# Compiled policies keyed by genome content, shared by the benign and attack runs
+# (and by elites that survive unchanged into later generations).
+worker_policy_cache = {}
+WORKER_POLICY_CACHE_SIZE = 256
+
 def init_worker(config):
     global worker_execution_titan
     # This creates a lightweight instance in each worker
     worker_foundry = SentinelFoundry(config)
     worker_execution_titan = worker_foundry.execution_titan
+    worker_payloads.update({'benign': worker_foundry.benign_payloads, 'attack': worker_foundry.attack_payloads})
+
+def _compiled_policy_for(genome: dict) -> dict:
+    policy_key = hash(json.dumps(genome, sort_keys=True))
+    compiled_policy = worker_policy_cache.get(policy_key)
+    if compiled_policy is None:
+        if len(worker_policy_cache) >= WORKER_POLICY_CACHE_SIZE: worker_policy_cache.clear()
+        compiled_policy = worker_policy_cache[policy_key] = worker_execution_titan.compile_policy(genome)
+    return compiled_policy
 
 def evaluate_genome_worker(individual: dict) -> dict:
     genome = individual['genome']
-    benign_result = worker_execution_titan.instrumented_run(b'{"name": "COSMOS"}', genome)
-    attack_result = worker_execution_titan.instrumented_run(b'A' * 512, genome)
+    compiled_policy = _compiled_policy_for(genome)
+    benign_result = worker_execution_titan.instrumented_run(worker_payloads['benign'][0], genome, compiled_policy=compiled_policy)
+    attack_result = worker_execution_titan.instrumented_run(worker_payloads['attack'][0], genome, compiled_policy=compiled_policy)
     return {
         'id': individual['id'],
         'genome': genome,
@@ -52,6 +71,23 @@ def evaluate_genome_worker(individual: dict) -> dict:
         'attack_telemetry': attack_result['raw_telemetry']
     }
 
+def run_trial_worker(payload_kind: str, payload_index: int, genome: dict) -> str:
+    """Runs a single validation gauntlet trial against one of the worker's payloads and returns its outcome."""
+    payload = worker_payloads[payload_kind][payload_index]
+    return worker_execution_titan.instrumented_run(payload, genome, compiled_policy=_compiled_policy_for(genome))['outcome']
+
+_FITNESS_COMPONENTS = ('Correctness', 'Security', 'Perf. Penalty (CPU)', 'Perf. Penalty (Mem)', 'Elegance Penalty')
+
+def _fitness_batch(benign_survived, confidence, attack_survived, attack_telemetry_len, cpu_overhead, mem_overhead, genome_size):
+    """The numeric core of the Omega fitness function, evaluated for a whole population at once."""
+    correctness = np.where(benign_survived > 0, 500 * (confidence ** 2), -2000.0)
+    security = np.where(attack_survived > 0, -1000.0, 1000 / (1 + attack_telemetry_len))
+    cpu_penalty = - (cpu_overhead ** 1.5)
+    mem_penalty = - (mem_overhead / 10000)
+    elegance_penalty = - (genome_size / 50)
+    totals = correctness + security + np.where(correctness > 0, cpu_penalty + mem_penalty + elegance_penalty, 0.0)
+    return totals, dict(zip(_FITNESS_COMPONENTS, (correctness, security, cpu_penalty, mem_penalty, elegance_penalty)))
+
 class OmegaDebugger:
     """A fully decoupled, static forensic and diagnostic system."""
     log_file = PROJECT_ROOT / "artifacts/logs/omega_debugger.log"
@@ -100,12 +136,15 @@ def watchdog_thread(heartbeat_ref, is_running_ref, status_ref, threshold):
 
 class PathfinderDebugger:
     FREEZE_THRESHOLD_SECONDS = 300
+    GAUNTLET_TRIALS = 5
+    DASHBOARD_MIN_REFRESH_INTERVAL = 0.5
     def __init__(self, foundry: SentinelFoundry):
         self.foundry = foundry
         self.console = Console()
         self.ledger = Ledger(output_dir=str(PROJECT_ROOT / "artifacts/logs"))
         self.is_running_ref = [True]; self.heartbeat_ref = [time.time()]; self.status_ref = ["Initializing..."]
         self.final_champion = None; self.truth_reports = []
+        self._last_refresh = 0.0; self._last_refresh_status = None
         self.layout = self._create_layout()
 
 
@@ -116,13 +155,18 @@ class PathfinderDebugger:
         return layout
 
     def _update_dashboard(self, live: Live, footer_status: str):
-        self.heartbeat_ref[0] = time.time(); self.status_ref[0] = footer_status; self.foundry.population.sort(key=lambda x: x.get('fitness', -9999), reverse=True)
+        now = time.time()
+        self.heartbeat_ref[0] = now; self.status_ref[0] = footer_status
+        # A new status is always drawn; repeated redraws of the same status are throttled.
+        if footer_status == self._last_refresh_status and now - self._last_refresh < self.DASHBOARD_MIN_REFRESH_INTERVAL: return
+        self._last_refresh = now; self._last_refresh_status = footer_status
         pop_table = Table(title=f"Population Status (Epoch {self.foundry.epoch})", padding=(0, 1)); 
         pop_table.add_column("Rank", style="bold white"); 
         pop_table.add_column("GID"); 
         pop_table.add_column("Fitness", style="bold"); 
         pop_table.add_column("Genome Architecture")
-        for i, ind in enumerate(self.foundry.population[:15]):
+        # The population is only re-ordered once per generation; the dashboard just needs the visible top slice.
+        for i, ind in enumerate(heapq.nlargest(15, self.foundry.population, key=lambda x: x.get('fitness', -9999))):
              genome = ind.get('genome', {}); 
              num_states = len(genome.get('states', {})); 
              complexity = len(json.dumps(genome)); 
@@ -130,7 +174,7 @@ class PathfinderDebugger:
              style = "green" if ind.get('fitness', 0) > 0 else "yellow" if ind.get('fitness', 0) > -1000 else "red"; 
              pop_table.add_row(str(i+1), str(ind.get('id', 'N/A')), f"[{style}]{ind.get('fitness', -9999):+.2f}[/{style}]", arch_str)
         truth_panels = []
-        for report in sorted(self.truth_reports, key=lambda x: x.get('fitness', -9999), reverse=True)[:5]:
+        for report in heapq.nlargest(5, self.truth_reports, key=lambda x: x.get('fitness', -9999)):
             color = "green" if report.get('fitness', 0) > 0 else "red"; 
             outcome_panel = Panel(f"[bold]Breakdown:[/bold] {' | '.join([f'{k}: {v:+.1f}' for k, v in report.get('breakdown',{}).items()])}", title=f"GID {report.get('id', 'N/A')} | Fitness: {report.get('fitness', 0):+.2f}", border_style=color, padding=(1,2)); 
             truth_panels.append(outcome_panel)
@@ -140,63 +184,62 @@ class PathfinderDebugger:
         self.layout["footer"].update(Panel(Text(f"Status: {footer_status} | Normal Profile ID: {self.foundry.normal_profile_id}\nLedger Path: {self.ledger.ledger_path}", justify="left"), style="green")); 
         live.refresh()
 
-    def calculate_omega_fitness(self, truth_packet: dict) -> dict:
-        total_fitness = 0; breakdown = {}
-        benign_profile_analysis = self.foundry.performance_titan.analyze(truth_packet['benign_telemetry'])
-        if truth_packet['benign_outcome'] == 'survived':
-            confidence = benign_profile_analysis.get('confidence', {}).get(str(self.foundry.normal_profile_id), 0.0); 
-            breakdown['Correctness'] = 500 * (confidence ** 2)
-        else: breakdown['Correctness'] = -2000.0
-        total_fitness += breakdown['Correctness']
-        if truth_packet['attack_outcome'] != 'survived':
-            telemetry_len = len(truth_packet['attack_telemetry']); 
-            breakdown['Security'] = 1000 / (1 + telemetry_len) if telemetry_len > 0 else 1000.0
-        else: breakdown['Security'] = -1000.0
-        total_fitness += breakdown['Security']
-        if breakdown['Correctness'] > 0:
-            # NOTE: This internal import is preserved as per the original code
-            from cosmos.foundry.titans_pathfinder import _engineer_fingerprint_from_telemetry
+    def _fitness_inputs(self, truth_packet: dict) -> tuple:
+        """Reduces a truth packet to the numeric inputs of the Omega fitness function."""
+        benign_survived = truth_packet['benign_outcome'] == 'survived'
+        confidence = 0.0; cpu_overhead = 0.0; mem_overhead = 0.0
+        if benign_survived:
+            benign_profile_analysis = self.foundry.performance_titan.analyze(truth_packet['benign_telemetry'])
+            confidence = benign_profile_analysis.get('confidence', {}).get(str(self.foundry.normal_profile_id), 0.0)
+        # The fingerprint is only needed when the correctness score is positive.
+        if benign_survived and confidence != 0:
             fingerprint = _engineer_fingerprint_from_telemetry(truth_packet['benign_telemetry'], self.foundry.performance_titan.feature_list)
             cpu_overhead = fingerprint['cpu_percent_total_mean'].iloc[0] if not fingerprint.empty else 100.0
             mem_overhead = fingerprint['memory_rss_bytes_mean'].iloc[0] if not fingerprint.empty else 0
-            breakdown['Perf. Penalty (CPU)'] = - (cpu_overhead ** 1.5); 
-            breakdown['Perf. Penalty (Mem)'] = - (mem_overhead / 10000); 
-            breakdown['Elegance Penalty'] = - (len(json.dumps(truth_packet['genome'])) / 50)
-            total_fitness += breakdown['Perf. Penalty (CPU)'] + breakdown['Perf. Penalty (Mem)'] + breakdown['Elegance Penalty']
-        truth_packet.update({'fitness': total_fitness, 'breakdown': breakdown}); 
-        return truth_packet
+        attack_survived = truth_packet['attack_outcome'] == 'survived'
+        return (benign_survived, confidence, attack_survived, len(truth_packet['attack_telemetry']), cpu_overhead, mem_overhead, len(json.dumps(truth_packet['genome'])))
+
+    def calculate_omega_fitness(self, truth_packets: list) -> list:
+        """Scores a whole generation of truth packets in a single vectorized pass."""
+        if not truth_packets: return truth_packets
+        columns = list(zip(*(self._fitness_inputs(packet) for packet in truth_packets)))
+        totals, breakdown = _fitness_batch(*(np.asarray(column, dtype=np.float64) for column in columns))
+        has_penalties = breakdown['Correctness'] > 0
+        for i, truth_packet in enumerate(truth_packets):
+            keys = _FITNESS_COMPONENTS if has_penalties[i] else _FITNESS_COMPONENTS[:2]
+            truth_packet.update({'fitness': totals[i].item(), 'breakdown': {k: breakdown[k][i].item() for k in keys}})
+        return truth_packets
 
-    def run_evolution(self):
-        with Live(self.layout, screen=True, redirect_stderr=False, transient=True) as live:
+    def run_evolution(self, executor: ProcessPoolExecutor):
+        with Live(self.layout, screen=True, redirect_stderr=False, transient=True, refresh_per_second=2) as live:
             self.foundry.calibrate(); 
             self.foundry._initialize_population()
-            self.ledger.record_event(block_height=0, event_type="INITIAL_POPULATION_CREATED", details={"population": [ind.copy() for ind in self.foundry.population]})
-            with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker, initargs=(self.foundry.config,)) as executor:
-                for gen in range(self.foundry.generations):
-                    self.foundry.epoch = gen; 
-                    self._update_dashboard(live, f"Epoch {gen}: Evaluating Population...")
-                    futures = {executor.submit(evaluate_genome_worker, ind): ind for ind in self.foundry.population}
-                    try:
-                        raw_results = [future.result() for future in as_completed(futures)]
-                        self.truth_reports = [self.calculate_omega_fitness(res) for res in raw_results]
-                    except Exception as e:
-                        crashed_future = next((f for f in futures if f.done() and f.exception()), None)
-                        if crashed_future: 
-                            OmegaDebugger.log_critical_event("WORKER PROCESS CRASH", f"Exception during genome evaluation.", e, futures[crashed_future]); 
-                            self.console.print(Panel(f"[bold red]FATAL: Worker process crashed!\n\nRoot cause analysis saved to the Omega Debugger log.", title="[bold red]Crash Detected[/bold red]"))
-                        sys.exit(1)
-                    self.ledger.record_event(block_height=gen + 1, event_type="EVALUATION_COMPLETE", details={"generation": gen, "evaluation_results": self.truth_reports})
-                    for result in self.truth_reports:
-                        for pop_ind in self.foundry.population:
-                            if pop_ind['id'] == result['id']: pop_ind.update(result); break
-                    self._update_dashboard(live, f"Epoch {gen}: Evaluation Complete. Evolving...")
-                    self.foundry._evolve_population()
-                    self.ledger.record_event(block_height=gen + 1, event_type="CHAMPION_UPDATED", details={"generation": gen, "champion": self.foundry.population[0].copy()})
+            self.ledger.record_event(block_height=0, event_type="INITIAL_POPULATION_CREATED", details={"population": self.foundry.population})
+            for gen in range(self.foundry.generations):
+                self.foundry.epoch = gen; 
+                self._update_dashboard(live, f"Epoch {gen}: Evaluating Population...")
+                futures = {executor.submit(evaluate_genome_worker, ind): ind for ind in self.foundry.population}
+                try:
+                    # Pair each result with the individual it was submitted for; ids are not unique after evolution.
+                    completed = [(futures[future], future.result()) for future in as_completed(futures)]
+                    self.truth_reports = self.calculate_omega_fitness([result for _, result in completed])
+                except Exception as e:
+                    crashed_future = next((f for f in futures if f.done() and f.exception()), None)
+                    if crashed_future: 
+                        OmegaDebugger.log_critical_event("WORKER PROCESS CRASH", f"Exception during genome evaluation.", e, futures[crashed_future]); 
+                        self.console.print(Panel(f"[bold red]FATAL: Worker process crashed!\n\nRoot cause analysis saved to the Omega Debugger log.", title="[bold red]Crash Detected[/bold red]"))
+                    sys.exit(1)
+                self.ledger.record_event(block_height=gen + 1, event_type="EVALUATION_COMPLETE", details={"generation": gen, "evaluation_results": self.truth_reports})
+                for pop_ind, result in completed: pop_ind.update(result)
+                self._update_dashboard(live, f"Epoch {gen}: Evaluation Complete. Evolving...")
+                self.foundry._evolve_population()
+                self.foundry.population.sort(key=lambda x: x.get('fitness', -9999), reverse=True)
+                self.ledger.record_event(block_height=gen + 1, event_type="CHAMPION_UPDATED", details={"generation": gen, "champion": self.foundry.population[0]})
         self.final_champion = max(self.foundry.population, key=lambda x: x.get('fitness', -9999)) if self.foundry.population else None
         if self.final_champion: 
-            self.ledger.record_event(block_height=self.foundry.generations + 1, event_type="FINAL_CHAMPION_SYNTHESIZED", details={"final_champion": self.final_champion.copy()})
+            self.ledger.record_event(block_height=self.foundry.generations + 1, event_type="FINAL_CHAMPION_SYNTHESIZED", details={"final_champion": self.final_champion})
 
-    def run_scientific_validation_gauntlet(self):
+    def run_scientific_validation_gauntlet(self, executor: ProcessPoolExecutor):
         self.console.clear(); 
         self.console.rule("[bold cyan]SCIENTIFIC VALIDATION GAUNTLET[/bold cyan]", style="cyan");
         if not self.final_champion or self.final_champion.get('fitness', -9999) < 0: 
@@ -204,14 +247,17 @@ class PathfinderDebugger:
             return
         champion_genome = self.final_champion['genome']; 
         self.console.print("Champion will be subjected to tests it has not seen before.\n")
+        # Each trial is an independent subprocess run, so the trials of a test run concurrently on the warm workers.
+        def run_trials(payload_kind: str) -> list:
+            return list(executor.map(run_trial_worker, [payload_kind] * self.GAUNTLET_TRIALS, [0] * self.GAUNTLET_TRIALS, [champion_genome] * self.GAUNTLET_TRIALS))
         self.console.rule("Test 1: Correctness & Stability"); 
-        correctness_passes = sum(1 for _ in range(5) if self.foundry.execution_titan.instrumented_run(self.foundry.benign_payloads[0], genome=champion_genome)['outcome'] == 'survived'); 
-        self.console.print(f"  Result: {correctness_passes}/5 Benign Payloads Passed.")
+        correctness_passes = sum(1 for outcome in run_trials('benign') if outcome == 'survived'); 
+        self.console.print(f"  Result: {correctness_passes}/{self.GAUNTLET_TRIALS} Benign Payloads Passed.")
         self.console.rule("Test 2: Security Effectiveness"); 
-        security_passes = sum(1 for _ in range(5) if self.foundry.execution_titan.instrumented_run(self.foundry.attack_payloads[0], genome=champion_genome)['outcome'] != 'survived'); 
-        self.console.print(f"  Result: {security_passes}/5 Attack Payloads Blocked.")
+        security_passes = sum(1 for outcome in run_trials('attack') if outcome != 'survived'); 
+        self.console.print(f"  Result: {security_passes}/{self.GAUNTLET_TRIALS} Attack Payloads Blocked.")
         self.console.rule("[bold]Gauntlet Verdict[/bold]"); 
-        is_validated = correctness_passes == 5 and security_passes == 5
+        is_validated = correctness_passes == self.GAUNTLET_TRIALS and security_passes == self.GAUNTLET_TRIALS
         if is_validated: self.console.print("\n[bold green]SCIENTIFIC VALIDATION PASSED[/bold green]")
         else: self.console.print("\n[bold red]SCIENTIFIC VALIDATION FAILED[/bold red]")
 
@@ -237,8 +283,10 @@ class PathfinderDebugger:
         w_thread = threading.Thread(target=watchdog_thread, args=(self.heartbeat_ref, self.is_running_ref, self.status_ref, self.FREEZE_THRESHOLD_SECONDS), daemon=True); 
         w_thread.start()
         try:
-            self.run_evolution()
-            if self.final_champion: self.run_scientific_validation_gauntlet()
+            # One pool serves every phase, so workers pay the init_worker cost once.
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker, initargs=(self.foundry.config,)) as executor:
+                self.run_evolution(executor)
+                if self.final_champion: self.run_scientific_validation_gauntlet(executor)
         finally:
             self.is_running_ref[0] = False; 
             self.ledger.save(); 
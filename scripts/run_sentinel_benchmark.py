@@ -7,6 +7,7 @@
 # entry point for the new Sentinel architecture. It initializes and runs the
 # SentinelFoundry to evolve a hardened security agent configuration.
 
+import os
 import sys
 from pathlib import Path
 import typer
@@ -42,6 +43,7 @@ def run():
         "generations": 5, # Keep this low for a quick validation run
         "mutation_rate": 0.8,
         "elitism_count": 2,
+        "parallel_workers": max(1, (os.cpu_count() or 1) - 1),
     }
 
     try:
@@ -63,12 +65,11 @@ def run():
         console.print("\n[bold]This configuration represents the synthesized ruleset for the Aegis Sentinel.[/bold]")
         console.print("It has been evolved to maximize security (detecting attacks) while minimizing performance overhead.")
 
-    except Exception as e:
+    except Exception:
         console.print(f"\n[bold red]A FATAL ERROR OCCURRED DURING EVOLUTION[/bold red]")
-        console.print(e)
-        # It's helpful to see the full traceback for debugging
-        import traceback
-        traceback.print_exc()
+        # Rich renders the message and the full traceback in a single pass.
+        console.print_exception(show_locals=False, max_frames=10)
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
@@ -7,12 +7,12 @@
 # It includes robust error reporting in the profiling stage to provide
 # definitive evidence in case of a pre-flight failure.
 
+import os
 import sys
 from pathlib import Path
 import typer
 from rich.console import Console
 from rich.panel import Panel
-import re
 
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
@@ -32,18 +32,21 @@ def profile_target() -> int:
     titan = ExecutionTitan()
     normal_payload = b'{"name": "COSMOS", "version": 1}'
     
-    result = titan.instrumented_run(normal_payload)
-    if result['outcome'] != 'executed':
+    # An empty genome sets no policy limits, so the profiled run is never killed.
+    result = titan.instrumented_run(normal_payload, genome={}, trace_syscalls=True)
+    # Only a surviving traced run yields a trustworthy count (a run where strace
+    # was denied ptrace exits non-zero with nothing counted).
+    if result['outcome'] != 'survived' or not result.get('syscall_count'):
         # --- FORENSIC REPORTING ---
         error_panel = Panel(
-            result['strace_log'],
+            f"Outcome: {result['outcome']}, syscalls: {result.get('syscall_count')}",
             title="[bold red]Compiler/Execution Error[/bold red]",
             border_style="red"
         )
         console.print(error_panel)
-        raise RuntimeError(f"Profiling failed! The target could not be compiled or executed normally. Outcome: {result['outcome']}")
+        raise RuntimeError(f"Profiling failed! The target could not be executed normally under strace. Outcome: {result['outcome']}")
         
-    syscall_count = len(re.findall(r'^\w+\(.*\)\s*=', result['strace_log'], re.MULTILINE))
+    syscall_count = result['syscall_count']
     console.print(f"[green]  ✓ Profiling Complete:[/green] Baseline system calls is [bold yellow]{syscall_count}[/bold yellow].")
     return syscall_count
 
@@ -62,6 +65,7 @@ def run():
         foundry_config = {
             "population_size": 10, "generations": 10,
             "mutation_rate": 0.8, "elitism_count": 2,
+            "parallel_workers": max(1, (os.cpu_count() or 1) - 1),
         }
         
         foundry = SentinelFoundry(initial_sentinel_genome, foundry_config)
@@ -80,9 +84,10 @@ def run():
         else:
             console.print("\n[bold yellow]NEUTRAL RESULT:[/bold yellow] The foundry ran successfully but did not improve upon the baseline.")
 
-    except Exception as e:
+    except Exception:
         console.print(f"\n[bold red]A FATAL ERROR OCCURRED[/bold red]")
-        console.print(e)
+        console.print_exception(show_locals=False, max_frames=10)
+        raise typer.Exit(code=1)
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -24,6 +24,7 @@ sys.path.insert(0, str(project_root))
 
 from cosmos.parser.parser import CParser
 from cosmos.foundry.foundry import Foundry
+from cosmos.foundry.build_cache import compile_object_cached
 
 app = typer.Typer(name="COSMOS-Ω Baseline Engine Validator")
 console = Console()
@@ -39,9 +40,11 @@ def validate_artifact(champion_path: Path) -> bool:
         executable_path = Path(temp_dir) / "champion.out"
         
         console.print(f"  [1] Compiling champion with definitive harness: [cyan]{DEFINITIVE_HARNESS.name}[/cyan]")
-        compile_command = ["gcc", "-fno-stack-protector", "-o", str(executable_path), str(champion_path), str(DEFINITIVE_HARNESS)]
-        
-        compile_result = subprocess.run(compile_command, capture_output=True, text=True)
+        # The harness never changes, so it is linked in as a cached object.
+        compile_result, harness_object = compile_object_cached(["gcc", "-pipe", "-fno-stack-protector"], DEFINITIVE_HARNESS)
+        if compile_result.returncode == 0:
+            compile_command = ["gcc", "-pipe", "-fno-stack-protector", "-o", str(executable_path), str(champion_path), str(harness_object)]
+            compile_result = subprocess.run(compile_command, capture_output=True, text=True)
         if compile_result.returncode != 0:
             console.print("[bold red]  ❌ FATAL: Compilation Failed[/bold red]"); console.print(Panel(compile_result.stderr, title="Compiler Error", border_style="red")); return False
         console.print("[green]  ✅ Champion compiled successfully.[/green]")
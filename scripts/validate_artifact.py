@@ -10,17 +10,22 @@
 
 import sys
 from pathlib import Path
+from typing import List
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-import tempfile
+import uuid
 import subprocess
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Setup ---
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+from cosmos.foundry.build_cache import compile_cached, compile_object_cached, get_scratch_dir
+
 app = typer.Typer(name="COSMOS-Ω Artifact Validator")
 console = Console()
 
@@ -28,51 +33,68 @@ console = Console()
 # This harness is designed to work with the output of the baseline synthesis script.
 DEFINITIVE_HARNESS = project_root / "data/genomes/uranus/uranus_v1.0.c"
 
+PAYLOADS = [
+    b'This is a completely normal and safe input string.', # Normal Payload
+    b'A' * 512                                             # Attack Payload
+]
+
+def _compile(artifact_path: Path, harness_object: Path) -> tuple:
+    """Links one artifact against the precompiled harness into the scratch directory."""
+    executable_path = get_scratch_dir() / f"artifact-{uuid.uuid4().hex}.out"
+    return compile_cached(["gcc", "-pipe", "-fno-stack-protector"], [artifact_path, harness_object], executable_path, syntax_check=[artifact_path]), os.fspath(executable_path)
+
+def _run_payload(exe_str: str, payload: bytes) -> dict:
+    proc = subprocess.run([exe_str], input=payload, capture_output=True, timeout=5)
+    return {'outcome': 'survived' if proc.returncode == 0 else 'crashed'}
+
 @app.command()
 def validate(
-    artifact_path: Path = typer.Argument(..., exists=True, readable=True, help="Path to the synthesized C artifact to be validated.")
+    artifact_paths: List[Path] = typer.Argument(..., exists=True, readable=True, help="Path(s) to the synthesized C artifact(s) to be validated.")
 ):
     """
-    Compiles and validates a hardened C artifact against a resilience test suite.
+    Compiles and validates hardened C artifacts against a resilience test suite.
+    Several artifacts are compiled and tested concurrently.
     """
-    console.rule(f"[bold blue]Initiating Black Box Validation for: {artifact_path.name}[/bold blue]")
+    console.rule(f"[bold blue]Initiating Black Box Validation for: {', '.join(p.name for p in artifact_paths)}[/bold blue]")
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        executable_path = Path(temp_dir) / "artifact.out"
-        
-        console.print(f"  [1] Compiling artifact with definitive harness: [cyan]{DEFINITIVE_HARNESS.name}[/cyan]")
-        compile_command = ["gcc", "-fno-stack-protector", "-o", str(executable_path), str(artifact_path), str(DEFINITIVE_HARNESS)]
-        
-        compile_result = subprocess.run(compile_command, capture_output=True, text=True)
-        if compile_result.returncode != 0:
+    console.print(f"  [1] Compiling artifact with definitive harness: [cyan]{DEFINITIVE_HARNESS.name}[/cyan]")
+    # The harness never changes, so it is compiled once and linked in as a cached object.
+    harness_result, harness_object = compile_object_cached(["gcc", "-pipe", "-fno-stack-protector"], DEFINITIVE_HARNESS)
+    if harness_result.returncode != 0:
+        console.print("[bold red]  ❌ FATAL: Compilation Failed[/bold red]")
+        console.print(Panel(harness_result.stderr, title="Compiler Error", border_style="red"))
+        raise typer.Exit(code=1)
+
+    # gcc and the test runs all block on child processes, so one thread pool drives both stages.
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        builds = list(executor.map(lambda artifact_path: _compile(artifact_path, harness_object), artifact_paths))
+        failed = [(artifact_path, result) for artifact_path, (result, _) in zip(artifact_paths, builds) if result.returncode != 0]
+        if failed:
             console.print("[bold red]  ❌ FATAL: Compilation Failed[/bold red]")
-            console.print(Panel(compile_result.stderr, title="Compiler Error", border_style="red"))
+            for artifact_path, result in failed:
+                console.print(Panel(result.stderr, title=f"Compiler Error: {artifact_path.name}", border_style="red"))
             raise typer.Exit(code=1)
         console.print("[green]  ✅ Artifact compiled successfully.[/green]")
 
-        payloads = [
-            b'This is a completely normal and safe input string.', # Normal Payload
-            b'A' * 512                                             # Attack Payload
-        ]
-        results = []
         console.print("\n  [2] Executing resilience tests...")
-        for payload in payloads:
-            proc = subprocess.run([str(executable_path)], input=payload, capture_output=True, timeout=5)
-            results.append({'outcome': 'survived' if proc.returncode == 0 else 'crashed'})
-        
-        table = Table(title="Resilience Analysis")
+        jobs = [(exe_str, payload) for _, exe_str in builds for payload in PAYLOADS]
+        outcomes = list(executor.map(lambda job: _run_payload(*job), jobs))
+    
+    # The true definition of success for a hardened artifact
+    is_hardened = True
+    for i, artifact_path in enumerate(artifact_paths):
+        results = outcomes[i * len(PAYLOADS):(i + 1) * len(PAYLOADS)]
+        table = Table(title="Resilience Analysis" if len(artifact_paths) == 1 else f"Resilience Analysis: {artifact_path.name}")
         table.add_column("Payload Type", style="cyan"); table.add_column("Outcome", style="white")
-        table.add_row("Normal", results[1]['outcome'])
-        table.add_row("Attack", results[0]['outcome'])
+        table.add_row("Normal", results[0]['outcome'])
+        table.add_row("Attack", results[1]['outcome'])
         console.print(table)
-        
-        # The true definition of success for a hardened artifact
-        is_hardened = all(r['outcome'] == 'survived' for r in results)
-        
-        if is_hardened:
-            console.rule("[bold green]VALIDATION PASSED[/bold green]")
-        else:
-            console.rule("[bold red]VALIDATION FAILED[/bold red]")
+        is_hardened = is_hardened and all(r['outcome'] == 'survived' for r in results)
+    
+    if is_hardened:
+        console.rule("[bold green]VALIDATION PASSED[/bold green]")
+    else:
+        console.rule("[bold red]VALIDATION FAILED[/bold red]")
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
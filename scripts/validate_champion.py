@@ -8,8 +8,12 @@
 
 import subprocess
 import os
-import tempfile
+import sys
+import signal
+import struct
+import uuid
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -17,10 +21,21 @@ from rich.panel import Panel
 
 # --- Configuration ---
 project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from cosmos.foundry.build_cache import compile_cached, compile_object_cached, get_scratch_dir
+
 # This must point to the correct harness for the champion being tested.
 # For cronos_champion.c, the gaia harness is used.
 HARNESS_PATH = project_root / "data/genomes/uranus/uranus_v0.1.c" 
 # NOTE: The header directory is not needed for this simple, single-file target.
+# The batch driver runs the whole battery in one process (one fork per payload,
+# one exec in total) for quick smoke runs. Payloads then run one after another,
+# so a battery of hanging payloads takes N timeouts; it is off by default. Select
+# it per run with --fast-batch, or set COSMOS_VALIDATOR_BATCH=1.
+BATCH_DRIVER_PATH = project_root / "data/genomes/uranus/batch_driver.c"
+BATCH_MODE = os.environ.get("COSMOS_VALIDATOR_BATCH", "0") != "0"
+PAYLOAD_TIMEOUT = 5
 
 app = typer.Typer(name="COSMOS-Ω Champion Validator")
 console = Console()
@@ -32,7 +47,7 @@ def run_single_test(executable_path: str, payload: bytes) -> dict:
             [executable_path],
             input=payload,
             capture_output=True,
-            timeout=5
+            timeout=PAYLOAD_TIMEOUT
         )
         outcome = 'survived' if proc.returncode == 0 else 'crashed'
         return {'payload': payload.decode(errors='ignore'), 'outcome': outcome, 'returncode': proc.returncode}
@@ -41,75 +56,117 @@ def run_single_test(executable_path: str, payload: bytes) -> dict:
     except Exception as e:
         return {'payload': payload.decode(errors='ignore'), 'outcome': 'error', 'returncode': -1, 'stderr': str(e)}
 
+def run_batch(executable_path: str, payloads: list) -> list:
+    """
+    Streams every payload to the batch driver in one session and parses its
+    outcome lines. If the session as a whole times out, the payloads the
+    driver already reported keep their outcomes.
+    """
+    stream = b''.join(struct.pack('<I', len(payload)) + payload for payload in payloads)
+    try:
+        proc = subprocess.run(
+            [executable_path],
+            input=stream,
+            capture_output=True,
+            timeout=PAYLOAD_TIMEOUT * len(payloads) + PAYLOAD_TIMEOUT
+        )
+        stdout = proc.stdout
+    except subprocess.TimeoutExpired as e:
+        stdout = e.stdout or b''
+    # Only complete lines are reports; a kill can cut the last one short.
+    reports = stdout[:stdout.rfind(b'\n') + 1].decode(errors='ignore').splitlines()
+
+    results = []
+    for i, payload in enumerate(payloads):
+        text = payload.decode(errors='ignore')
+        if i >= len(reports):
+            results.append({'payload': text, 'outcome': 'error', 'returncode': -1, 'stderr': 'batch driver produced no report'})
+            continue
+        kind, value = reports[i].split()
+        code = int(value)
+        if kind == 'SIGNAL' and code == signal.SIGALRM:
+            results.append({'payload': text, 'outcome': 'timeout', 'returncode': -1})
+        elif kind == 'SIGNAL':
+            results.append({'payload': text, 'outcome': 'crashed', 'returncode': -code})
+        else:
+            results.append({'payload': text, 'outcome': 'survived' if code == 0 else 'crashed', 'returncode': code})
+    return results
+
 @app.command()
 def validate(
-    champion_path: Path = typer.Argument(..., exists=True, readable=True, help="Path to the hardened champion C file to be validated.")
+    champion_path: Path = typer.Argument(..., exists=True, readable=True, help="Path to the hardened champion C file to be validated."),
+    fast_batch: bool = typer.Option(BATCH_MODE, "--fast-batch/--no-fast-batch", help="Run the whole battery through one batch-driver process instead of one process per payload.")
 ):
     """
     Compiles and runs a hardened champion against a suite of attack payloads.
     """
     console.rule(f"[bold blue]Initiating Validation for Champion: {champion_path.name}[/bold blue]")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        executable_path = os.path.join(temp_dir, "champion.out")
-
-        console.print(f"  [1] Compiling champion...")
-        # Simplified compile command for single-file champions
-        compile_command = [
-            "gcc", "-fno-stack-protector",
-            "-o", executable_path,
-            str(champion_path),
-            str(HARNESS_PATH),
-        ]
-        
-        compile_result = subprocess.run(compile_command, capture_output=True, text=True)
+    executable_path = os.fspath(get_scratch_dir() / f"champion-{uuid.uuid4().hex}.out")
+
+    console.print(f"  [1] Compiling champion...")
+    # Simplified compile command for single-file champions
+    # The harness (and batch driver) never change, so they are linked in as cached objects.
+    compiler_args = ["gcc", "-pipe", "-fno-stack-protector"] + (["-Dmain=cosmos_harness_main"] if fast_batch else [])
+    fixed_sources = [HARNESS_PATH, BATCH_DRIVER_PATH] if fast_batch else [HARNESS_PATH]
+    objects = []
+    for source in fixed_sources:
+        compile_result, object_path = compile_object_cached(compiler_args, source)
         if compile_result.returncode != 0:
-            console.print("[bold red]  ❌ FATAL: Compilation Failed[/bold red]")
-            console.print(Panel(compile_result.stderr, title="Compiler Error", border_style="red"))
-            return
-
-        console.print("[green]  ✅ Champion compiled successfully.[/green]")
-
-        # --- Test Battery ---
-        payloads = [
-            b'A' * 64,
-            b'B' * 256,
-            b'C' * 1024,
-            b'%s%s%s%s',
-            b'This is a normal input string.',
-        ]
-
-        console.print("\n  [2] Executing test battery...")
-        results = []
-        for payload in payloads:
-            results.append(run_single_test(executable_path, payload))
+            break
+        objects.append(object_path)
+    else:
+        compile_result = compile_cached(compiler_args, [champion_path, *objects], Path(executable_path), syntax_check=[champion_path])
+    if compile_result.returncode != 0:
+        console.print("[bold red]  ❌ FATAL: Compilation Failed[/bold red]")
+        console.print(Panel(compile_result.stderr, title="Compiler Error", border_style="red"))
+        return
+
+    console.print("[green]  ✅ Champion compiled successfully.[/green]")
+
+    # --- Test Battery ---
+    payloads = [
+        b'A' * 64,
+        b'B' * 256,
+        b'C' * 1024,
+        b'%s%s%s%s',
+        b'This is a normal input string.',
+    ]
+
+    console.print("\n  [2] Executing test battery...")
+    if fast_batch:
+        results = run_batch(executable_path, payloads)
+    else:
+        # Each test blocks on its own child process, so the battery runs concurrently.
+        with ThreadPoolExecutor(max_workers=min(len(payloads), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(lambda payload: run_single_test(executable_path, payload), payloads))
+    
+    console.print("[green]  ✅ Test battery complete.[/green]")
+
+    console.rule("[bold green]Validation Report[/bold green]")
+    table = Table(title=f"Resilience Analysis for {champion_path.name}")
+    table.add_column("Payload", style="cyan")
+    table.add_column("Outcome", style="white")
+    table.add_column("Return Code", style="magenta")
+
+    successes = 0
+    for res in results:
+        style = "red" # Default to fail
+        is_attack = "normal" not in res['payload']
         
-        console.print("[green]  ✅ Test battery complete.[/green]")
-
-        console.rule("[bold green]Validation Report[/bold green]")
-        table = Table(title=f"Resilience Analysis for {champion_path.name}")
-        table.add_column("Payload", style="cyan")
-        table.add_column("Outcome", style="white")
-        table.add_column("Return Code", style="magenta")
-
-        successes = 0
-        for res in results:
-            style = "red" # Default to fail
-            is_attack = "normal" not in res['payload']
-            
-            if res['outcome'] == 'survived' and not is_attack:
-                style = "green"
-                successes += 1
-            elif res['outcome'] == 'crashed' and is_attack:
-                style = "yellow"
-                successes += 1
-            
-            table.add_row(res['payload'][:30] + "...", f"[{style}]{res['outcome']}[/{style}]", str(res['returncode']))
-
-        console.print(table)
+        if res['outcome'] == 'survived' and not is_attack:
+            style = "green"
+            successes += 1
+        elif res['outcome'] == 'crashed' and is_attack:
+            style = "yellow"
+            successes += 1
         
-        final_score = (successes / len(payloads)) * 100
-        console.print(f"\n[bold]Final Resilience Score: [yellow]{final_score:.1f}%[/yellow][/bold] ({successes}/{len(payloads)} tests passed)")
+        table.add_row(res['payload'][:30] + "...", f"[{style}]{res['outcome']}[/{style}]", str(res['returncode']))
+
+    console.print(table)
+    
+    final_score = (successes / len(payloads)) * 100
+    console.print(f"\n[bold]Final Resilience Score: [yellow]{final_score:.1f}%[/yellow][/bold] ({successes}/{len(payloads)} tests passed)")
 
 # --- THE CRUCIAL EXECUTION BLOCK ---
 # This was missing from the previous version. It tells Python to actually
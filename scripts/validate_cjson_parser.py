@@ -9,6 +9,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
 from cosmos.parser.parser import CParser
+from cosmos.parser.ast_cache import cached_parse
 
 def main():
     """
@@ -26,7 +27,7 @@ def main():
 
     try:
         parser = CParser()
-        ast = parser.parse_file(cjson_source_path, cpp_args=[r'-Idata/genomes/cjson'])
+        ast = cached_parse(cjson_source_path, parser.parse_file, cpp_args=[r'-Idata/genomes/cjson'])
         
         print("\n[SUCCESS] cJSON source code parsed successfully.")
         
@@ -29,6 +29,7 @@ print("[TRACE] System path modified.")
 # --- TRACE POINT 2: Attempting to import from cosmos.parser.parser ---
 print("[TRACE] Attempting to import 'parse_c_file_to_ast'...")
 from cosmos.parser.parser import parse_c_file_to_ast
+from cosmos.parser.ast_cache import cached_parse
 print("[TRACE] SUCCESS: Imported 'parse_c_file_to_ast'.")
 
 # --- TRACE POINT 3: Attempting to import from cosmos.foundry.foundry ---
@@ -61,8 +62,8 @@ def main():
     # 2. Parse the source code into ASTs using the correct function
     print("\n[2] Parsing source files into ASTs...")
     try:
-        initial_cronos_ast = parse_c_file_to_ast(cronos_path)
-        initial_gaia_ast = parse_c_file_to_ast(gaia_path)
+        initial_cronos_ast = cached_parse(cronos_path, parse_c_file_to_ast)
+        initial_gaia_ast = cached_parse(gaia_path, parse_c_file_to_ast)
         print("  - Parsing complete.")
     except Exception as e:
         print(f"\n  - FATAL ERROR during parsing: {e}")
@@ -48,6 +48,7 @@ def main():
         
         compile_command = [
             RISCV_COMPILER,
+            "-pipe", # Hand cc1 -> as output over pipes instead of temp files.
             "-o", output_path,
             APP_SOURCE_PATH,
             DEFENDER_SOURCE_PATH,
@@ -56,7 +57,10 @@ def main():
         ]
         
         print(f"  Running command: {' '.join(compile_command)}")
-        result = subprocess.run(compile_command, capture_output=True, text=True)
+        # close_fds=False lets subprocess use posix_spawn() instead of fork()+exec().
+        # Python opens its own descriptors non-inheritable, so nothing leaks into gcc.
+        # stdout is never inspected, and stderr is only decoded if the build fails.
+        result = subprocess.run(compile_command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, close_fds=False)
         
         if result.returncode == 0:
             print(f"  [SUCCESS] Compilation and linking successful!")
@@ -64,8 +68,8 @@ def main():
             print("\n--- NEW BASELINE ESTABLISHED: TEST PASSED ---")
         else:
             print("  [FAILURE] Compilation failed.")
-            print("\n--- FOCUSED COMPILER ERRORS ---")
-            print(result.stderr)
+            print("\n--- FOCUSED COMPILER ERRORS ---", flush=True)
+            sys.stderr.write(result.stderr.decode('utf-8', errors='replace'))
             print("\n--- TEST FAILED ---")
 
 if __name__ == "__main__":
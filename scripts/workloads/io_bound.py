@@ -2,55 +2,78 @@
 
 import os
 import time
-import uuid
+import random
+from itertools import count
 from pathlib import Path
 
+# Each iteration scatters block-sized writes over one large sparse file, forces
+# them to disk and drops them from the page cache, so the reads that follow
+# are served by the device rather than by memory.
+FILE_SIZE = 64 * 1024 * 1024
+BLOCK_SIZE = 64 * 1024
+BLOCKS_PER_ITERATION = 64
+
 def run_io_bound_workload(duration_seconds: int, temp_dir: Path):
     """
-    Simulates an I/O-bound workload by creating, writing to, reading from,
-    and deleting many small temporary files.
+    Simulates an I/O-bound workload by scattering writes over a large
+    temporary file, evicting it from the page cache and reading it back.
 
     Args:
         duration_seconds: The approximate duration to run the workload.
         temp_dir: The directory to perform file operations in.
     """
     print(f"[Workload:IO] Starting I/O-bound task for {duration_seconds} seconds.")
-    start_time = time.time()
+    deadline = time.monotonic_ns() + duration_seconds * 1_000_000_000
     files_created = []
 
     # Ensure the temp directory for this workload exists
     workload_temp_dir = temp_dir / "io_workload"
     workload_temp_dir.mkdir(exist_ok=True)
     
-    # Some dummy data to write
+    # Some dummy data to write, repeated up to one block
     dummy_data = b"ForgeX4 COSMOS-Omega Digital Twin Telemetry Data." * 10
+    block = (dummy_data * (BLOCK_SIZE // len(dummy_data) + 1))[:BLOCK_SIZE]
+    # A per-process counter names the files; unlike uuid4() it needs no urandom read.
+    file_ids = count()
+    pid = os.getpid()
+    # The offsets are drawn (sample + shuffle) every iteration, from a generator
+    # owned by this run rather than the `random` module's process-wide instance.
+    rng = random.Random()
 
     try:
-        while (time.time() - start_time) < duration_seconds:
-            # Create a few files
-            for _ in range(5):
-                file_path = workload_temp_dir / f"temp_{uuid.uuid4()}.tmp"
-                with open(file_path, "wb") as f:
-                    f.write(dummy_data)
-                files_created.append(file_path)
-
-            # Read a few files
-            for i in range(min(5, len(files_created))):
-                file_to_read = files_created[i]
-                with open(file_to_read, "rb") as f:
-                    _ = f.read()
-
-            # Delete a few files to keep the total number from exploding
-            if len(files_created) > 50:
-                for _ in range(5):
-                    file_to_delete = files_created.pop(0)
-                    os.remove(file_to_delete)
+        while time.monotonic_ns() < deadline:
+            file_path = os.path.join(workload_temp_dir, f"temp_{pid}_{next(file_ids):08x}.tmp")
+            fd = os.open(file_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+            files_created.append(file_path)
+            try:
+                os.ftruncate(fd, FILE_SIZE)
+
+                # Scattered writes at random block-aligned offsets
+                offsets = rng.sample(range(0, FILE_SIZE, BLOCK_SIZE), BLOCKS_PER_ITERATION)
+                for offset in offsets:
+                    os.pwrite(fd, block, offset)
+
+                # Dirty pages cannot be dropped, so write them back before evicting the file.
+                os.fsync(fd)
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, FILE_SIZE, os.POSIX_FADV_DONTNEED)
+
+                # Read the blocks back in a different order
+                rng.shuffle(offsets)
+                for offset in offsets:
+                    _ = os.pread(fd, BLOCK_SIZE, offset)
+            finally:
+                os.close(fd)
+
+            os.unlink(files_created.pop())
     
     finally:
         # Clean up all created files
         for file_path in files_created:
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
         print("[Workload:IO] Finished task and cleaned up temporary files.")
 
 if __name__ == '__main__':
@@ -1,45 +1,58 @@
 # scripts/workloads/memory_bound.py
 
 import time
-import random
+import numpy as np
 
 def run_memory_bound_workload(duration_seconds: int):
     """
-    Simulates a memory-bound workload by allocating and manipulating
-    large lists in memory.
+    Simulates a memory-bound workload by repeatedly refilling and reducing
+    a ring of large integer arrays in memory.
 
     Args:
         duration_seconds: The approximate duration to run the workload.
     """
     print(f"[Workload:Memory] Starting memory-bound task for {duration_seconds} seconds.")
-    start_time = time.time()
+    deadline = time.monotonic_ns() + duration_seconds * 1_000_000_000
     
-    # We will work with a list of lists (a matrix-like structure)
+    # We will work with a ring of arrays (a matrix-like structure)
     # The size is chosen to be significant but not crippling on a system with 16GB RAM.
+    # Each array is a contiguous int32 buffer (~20MB), so the loop is bound by
+    # memory bandwidth rather than by boxing millions of Python ints.
     list_size = 5_000_000 # 5 million integers
-    data_structure = []
+    ring_size = 4 # As many arrays as the old append/pop cycle kept alive at once
+    rng = np.random.default_rng()
 
-    # Initial allocation
+    # Initial allocation: the whole ring, once. The loop only refills it in place.
     print(f"[Workload:Memory] Allocating initial list of {list_size:,} integers...")
-    data_structure.append([random.randint(0, 1000) for _ in range(list_size)])
+    ring = [np.empty(list_size, dtype=np.int32) for _ in range(ring_size)]
+    scratch = np.empty(list_size) # float64 staging for the in-place refill
+
+    def refill(buffer):
+        rng.random(out=scratch)
+        np.multiply(scratch, 1001, out=scratch)
+        np.copyto(buffer, scratch, casting='unsafe') # Truncates to 0..1001
+        np.minimum(buffer, 1000, out=buffer) # Guards the x * 1001 == 1001.0 rounding edge
+
+    refill(ring[0])
+    filled = 1
 
     try:
-        while (time.time() - start_time) < duration_seconds:
-            # Operation 1: Create a new list and append
-            new_list = [random.randint(0, 1000) for _ in range(list_size)]
-            data_structure.append(new_list)
-
-            # Operation 2: Sum the elements of a random list
-            list_to_sum = random.choice(data_structure)
-            _ = sum(list_to_sum) # The result is discarded, we only care about the operation
-
-            # Operation 3: Remove a list to keep memory usage from growing indefinitely
-            if len(data_structure) > 3:
-                list_to_remove = data_structure.pop(0)
-                del list_to_remove # Hint to the garbage collector
+        iteration = 1
+        while time.monotonic_ns() < deadline:
+            # Operation 1: Overwrite the oldest array with fresh values
+            refill(ring[iteration % ring_size])
+            filled = min(filled + 1, ring_size)
+            iteration += 1
+
+            # Operation 2: Sum the elements of a random array
+            list_to_sum = ring[rng.integers(filled)]
+            _ = list_to_sum.sum() # The result is discarded, we only care about the operation
     
     finally:
-        del data_structure # Clean up the reference
+        # Buffers this large are mmap-backed and are unmapped as soon as their last
+        # reference goes, so drop every one (including the loop's alias) right here.
+        ring.clear()
+        list_to_sum = scratch = None
         print("[Workload:Memory] Finished task and cleaned up memory.")
 
 
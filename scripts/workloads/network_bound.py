@@ -1,8 +1,8 @@
 # scripts/workloads/network_bound.py
 
 import time
-import requests
-import concurrent.futures
+import random
+import asyncio
 
 # A list of reliable, high-availability public APIs to query.
 # Using multiple endpoints makes the test more robust.
@@ -13,14 +13,33 @@ URLS = [
     "https://httpbin.org/get",
 ]
 
-def fetch_url(url):
-    """Makes a single GET request and returns the status code."""
+# Requests in flight per batch. All of them share one event loop and one
+# client, whose keep-alive pool lets each host's connections be reused.
+BATCH_SIZE = 64
+
+async def fetch_url(client, url: str, http_error: type):
+    """Makes a single GET request and returns the status code (None on `http_error`)."""
     try:
-        response = requests.get(url, timeout=5)
+        response = await client.get(url)
         return response.status_code
-    except requests.RequestException:
+    except http_error:
         return None
 
+async def _run_batches(duration_seconds: int):
+    # httpx (and its transport stack) is imported once, when the workload runs, so
+    # loading this module costs nothing; fetch_url receives the client and error type.
+    import httpx
+    deadline = time.monotonic_ns() + duration_seconds * 1_000_000_000
+    rng = random.Random()
+    limits = httpx.Limits(max_connections=BATCH_SIZE, max_keepalive_connections=BATCH_SIZE)
+    async with httpx.AsyncClient(timeout=5, limits=limits) as client:
+        while time.monotonic_ns() < deadline:
+            # Submit a batch of requests and wait for this batch to complete
+            await asyncio.gather(*(fetch_url(client, rng.choice(URLS), httpx.HTTPError) for _ in range(BATCH_SIZE)))
+            
+            # A small delay to prevent overwhelming the network or getting rate-limited
+            await asyncio.sleep(0.1)
+
 def run_network_bound_workload(duration_seconds: int):
     """
     Simulates a network-bound workload by making concurrent HTTP requests
@@ -30,20 +49,9 @@ def run_network_bound_workload(duration_seconds: int):
         duration_seconds: The approximate duration to run the workload.
     """
     print(f"[Workload:Network] Starting network-bound task for {duration_seconds} seconds.")
-    start_time = time.time()
     
-    # We use a ThreadPoolExecutor for I/O-bound tasks like network requests.
-    # This allows us to make many requests concurrently.
-    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-        while (time.time() - start_time) < duration_seconds:
-            # Submit a batch of requests
-            futures = [executor.submit(fetch_url, random.choice(URLS)) for _ in range(20)]
-            
-            # Wait for this batch to complete
-            concurrent.futures.wait(futures)
-            
-            # A small delay to prevent overwhelming the network or getting rate-limited
-            time.sleep(0.1)
+    # A single asyncio event loop multiplexes every request; no worker threads are needed.
+    asyncio.run(_run_batches(duration_seconds))
 
     print("[Workload:Network] Finished task.")
 
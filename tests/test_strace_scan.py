@@ -0,0 +1,32 @@
+#
+# File: tests/test_strace_scan.py
+#
+# Description:
+# Checks the strace syscall counter against real, column-padded strace output.
+#
+
+import io
+
+from cosmos.foundry.strace_scan import count_syscalls
+
+# Verbatim shape of `strace -o` output: short calls are padded to column 40.
+PADDED_LOG = b"""execve("./sentinel_target.out", ["./sentinel_target.out"], 0x7ffd5c0e4f30 /* 24 vars */) = 0
+brk(NULL)                               = 0x55d0c0a5e000
+arch_prctl(0x3001 /* ARCH_??? */, 0x7ffe3a6c2b10) = -1 EINVAL (Invalid argument)
+openat(AT_FDCWD, "/etc/ld.so.cache", O_RDONLY|O_CLOEXEC) = 3
+_llseek(3, 0, [0], SEEK_SET)            = 0
+read(0, "{\\"name\\": \\"COSMOS\\"}) = 1", 4096) = 20
+--- SIGSEGV {si_signo=SIGSEGV, si_code=SEGV_MAPERR, si_addr=NULL} ---
++++ killed by SIGSEGV (core dumped) +++
+"""
+
+def test_counts_padded_and_underscore_calls():
+    assert count_syscalls(PADDED_LOG) == 6
+
+def test_skips_resumed_and_unfinished_lines():
+    log = b"read(0,  <unfinished ...>\n<... read resumed>\"x\", 4096) = 1\nexit_group(0)                           = ?\n"
+    assert count_syscalls(log) == 1
+
+def test_accepts_text_and_streamed_lines():
+    assert count_syscalls(PADDED_LOG.decode()) == 6
+    assert count_syscalls(io.BytesIO(PADDED_LOG)) == 6